@@ -1,19 +1,26 @@
 from __future__ import annotations
 import argparse
 import dataclasses
+import functools
 import json
 import os
 import re
+import shutil
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple
+from urllib.parse import urljoin
 
 # Third-party
 try:
     import requests
-    from bs4 import BeautifulSoup
+    from requests.adapters import HTTPAdapter
+    from lxml import etree
+    from lxml import html as lxml_html
     from selenium import webdriver
+    from selenium.common.exceptions import TimeoutException
     from selenium.webdriver.common.by import By
     from selenium.webdriver.support.ui import WebDriverWait
     from selenium.webdriver.support import expected_conditions as EC
@@ -21,19 +28,70 @@ try:
     from selenium.webdriver.firefox.options import Options as FirefoxOptions
 except Exception as e:
     print("Missing dependencies. Please install:\n"
-          "  pip install selenium beautifulsoup4 requests lxml\n"
+          "  pip install selenium requests lxml\n"
           f"Error: {e}")
     sys.exit(1)
 
+# Optional: faster JSON serialization for large result files
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional: single-pass keyword matching for cause-list row labels
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 
 # === Constants (official entry points) ===
 ECOURTS_HOME = "https://services.ecourts.gov.in/ecourtindia_v6/"
 ECOURTS_CAUSELIST = "https://services.ecourts.gov.in/ecourtindia_v6/?p=cause_list/index"
 
+# Elements whose presence means a result page has rendered
+CASE_STATUS_READY = (By.CSS_SELECTOR, "table")
+CAUSELIST_READY = (By.CSS_SELECTOR, "table tr td")
+
 # Output directories
 DEFAULT_OUT_DIR = os.path.join(os.getcwd(), "outputs")
 DEFAULT_DL_DIR = os.path.join(os.getcwd(), "downloads")
 
+# Concurrent PDF downloads (I/O bound)
+PDF_DOWNLOAD_WORKERS = 8
+
+# Pre-compiled patterns used by the parsing helpers (hot path on large pages)
+_CASE_NO_RE = re.compile(r"(Case\s*No\.?|Case\s*Number)\s*[:\-]?\s*([A-Za-z./\-\s]*\d+\/\d{4})", re.I)
+_CNR_RE = re.compile(r"(CNR\s*No\.?)\s*[:\-]?\s*([A-Z0-9]{16})", re.I)
+_COURT_RE = re.compile(r"(Court\s*Name|Court)\s*[:\-]?\s*([^\n\r]+)", re.I)
+_DATE_RE = re.compile(r"(\d{2}-\d{2}-\d{4})")
+_PURPOSE_RE = re.compile(r"(Purpose|Stage)\s*[:\-]?\s*([A-Za-z0-9 ,./()_-]{3,60})", re.I)
+_PURPOSE_LABEL_RE = re.compile(r"Purpose|Stage", re.I)
+_SERIAL_RE = re.compile(r"\d{1,4}")
+_CASE_TEXT_RE = re.compile(r"[A-Za-z]{1,10}\s*\d{1,6}\/\d{4}|\b\d{1,6}\/\d{4}\b")
+# Row labels, matched against the lower-cased row text (cells joined by _CELL_SEP) so the
+# engine compares plain literals instead of case-folding every character
+_CELL_SEP = "\x01"
+_PURPOSE_CELL_RE = re.compile(r"purpose|stage|for hearing|listing")
+_COURT_CELL_RE = re.compile(r"\bcourt\b")
+# Same labels as (keyword, field) pairs for the Aho-Corasick automaton
+_ROW_LABELS = (
+    ("purpose", "purpose"),
+    ("stage", "purpose"),
+    ("for hearing", "purpose"),
+    ("listing", "purpose"),
+    ("court", "court"),
+)
+_WS_RE = re.compile(r"\s+")
+_SANITIZE_RE = re.compile(r"[^\w\-\.]+")
+
+# Visible text nodes below an element, joined like get_text(" ", strip=True)
+_TEXT_XPATH = etree.XPath(".//text()[not(parent::script or parent::style)]", smart_strings=False)
+# Table rows with 2+ cells; single-cell layout/heading rows are skipped inside lxml.
+# The serial check itself runs on the extracted cell text (_SERIAL_RE), since XPath's
+# normalize-space() neither strips &nbsp; nor ignores <script> text like _node_text does.
+_TABLE_ROW_XPATH = etree.XPath("descendant-or-self::table//tr[count(td|th) >= 2]")
+
 
 # === Utilities ===
 
@@ -55,16 +113,22 @@ def date_str_ist(days_from_today: int = 0) -> str:
 
 def save_json(obj: Any, path: str) -> None:
     ensure_dir(os.path.dirname(path))
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
     with open(path, "w", encoding="utf-8") as f:
         json.dump(obj, f, ensure_ascii=False, indent=2)
 
-def save_text(text: str, path: str) -> None:
+def save_text_lines(lines: Iterable[str], path: str) -> None:
+    # lines must already end with "\n"; written as-is without building one big string
     ensure_dir(os.path.dirname(path))
     with open(path, "w", encoding="utf-8") as f:
-        f.write(text)
+        f.writelines(lines)
 
+@functools.lru_cache(maxsize=1024)
 def sanitize_filename(name: str) -> str:
-    return re.sub(r"[^\w\-\.]+", "_", name).strip("_")
+    return _SANITIZE_RE.sub("_", name).strip("_")
 
 def log(msg: str, verbose: bool) -> None:
     if verbose:
@@ -73,44 +137,119 @@ def log(msg: str, verbose: bool) -> None:
 
 # === Parsing helpers ===
 
+def _html_root(html: str):
+    """Parses page HTML with lxml; returns None for an empty document."""
+    try:
+        return lxml_html.fromstring(html)
+    except etree.ParserError:
+        return None
+    except ValueError:
+        # str input carrying an XML encoding declaration (XHTML page_source)
+        return lxml_html.fromstring(html.encode("utf-8"))
+
+def _node_text(node) -> str:
+    return " ".join(t for t in (s.strip() for s in _TEXT_XPATH(node)) if t)
+
+def _row_text(tds: List[str]) -> str:
+    """
+    Lower-cased row text with _CELL_SEP exactly between cells. Page text may itself contain
+    "\x01" (e.g. &#1;); such stray characters are swapped for another non-word character
+    so that separator counts always map a match offset to the right cell (see _cell_at).
+    """
+    row_text = _CELL_SEP.join(tds)
+    if row_text.count(_CELL_SEP) != len(tds) - 1:
+        row_text = _CELL_SEP.join([t.replace(_CELL_SEP, "\x02") for t in tds])
+    return row_text.lower()
+
+def _cell_at(tds: List[str], row_text: str, pos: int) -> str:
+    """Returns the cell of tds containing offset pos of _row_text(tds)."""
+    return tds[row_text.count(_CELL_SEP, 0, pos)]
+
+def _build_label_automaton():
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword, field in _ROW_LABELS:
+        automaton.add_word(keyword, (field, len(keyword)))
+    automaton.make_automaton()
+    return automaton
+
+_LABEL_AUTOMATON = _build_label_automaton()
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+def _row_labels(tds: List[str], row_text: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Finds the first purpose/stage cell and the first 'court' cell of a row in one automaton
+    pass over its _row_text (cells joined by _CELL_SEP). Same results as
+    _PURPOSE_CELL_RE / _COURT_CELL_RE; only used when pyahocorasick is installed.
+    """
+    purpose = None
+    court_text = None
+    for end, (field, size) in _LABEL_AUTOMATON.iter(row_text):
+        start = end - size + 1
+        if field == "court":
+            if court_text is not None:
+                continue
+            # whole word only, like \bcourt\b
+            if start > 0 and _is_word_char(row_text[start - 1]):
+                continue
+            if end + 1 < len(row_text) and _is_word_char(row_text[end + 1]):
+                continue
+            court_text = _cell_at(tds, row_text, start)
+        elif purpose is None:
+            purpose = _cell_at(tds, row_text, start)
+        if purpose is not None and court_text is not None:
+            break
+    return purpose, court_text
+
 def parse_case_status_html(html: str) -> Dict[str, Any]:
     """
     Heuristic parser for the CNR 'Case Status' result page.
     Tries to extract key details including court name, case number, and hearing dates.
     """
-    soup = BeautifulSoup(html, "lxml")
-
-    text = soup.get_text(" ", strip=True)
+    root = _html_root(html)
+    text = _node_text(root) if root is not None else ""
 
     # Very heuristic extraction attempts:
     case_no = None
-    m = re.search(r"(Case\s*No\.?|Case\s*Number)\s*[:\-]?\s*([A-Za-z./\-\s]*\d+\/\d{4})", text, re.I)
+    m = _CASE_NO_RE.search(text)
     if m:
         case_no = m.group(2).strip()
 
     cnr_found = None
-    m = re.search(r"(CNR\s*No\.?)\s*[:\-]?\s*([A-Z0-9]{16})", text, re.I)
+    m = _CNR_RE.search(text)
     if m:
         cnr_found = m.group(2).strip()
 
     court_name = None
-    m = re.search(r"(Court\s*Name|Court)\s*[:\-]?\s*([^\n\r]+)", text, re.I)
+    m = _COURT_RE.search(text)
     if m:
         court_name = m.group(2).strip()
 
     # Try to extract a table of hearings (date, stage/purpose).
     hearings: List[Dict[str, str]] = []
+    # Single pass for 'Purpose'/'Stage' labels; each date then tries an anchored
+    # match at the labels inside its window instead of re-scanning the window.
+    labels = [m.start() for m in _PURPOSE_LABEL_RE.finditer(text)]
+    l_idx = 0
     # Look for date patterns dd-mm-yyyy
-    for dt_match in re.finditer(r"(\d{2}-\d{2}-\d{4})", text):
+    for dt_match in _DATE_RE.finditer(text):
         dt = dt_match.group(1)
-        # Look around the date for words 'Purpose', 'Stage', 'Hearing'
+        # Look around the date for words 'Purpose', 'Stage'
         span_start = max(dt_match.start() - 60, 0)
         span_end = min(dt_match.end() + 80, len(text))
-        window = text[span_start:span_end]
+        while l_idx < len(labels) and labels[l_idx] < span_start:
+            l_idx += 1
         purpose = None
-        m2 = re.search(r"(Purpose|Stage)\s*[:\-]?\s*([A-Za-z0-9 ,./()_-]{3,60})", window, re.I)
-        if m2:
-            purpose = m2.group(2).strip()
+        i = l_idx
+        while i < len(labels) and labels[i] < span_end:
+            m2 = _PURPOSE_RE.match(text, labels[i], span_end)
+            if m2:
+                purpose = m2.group(2).strip()
+                break
+            i += 1
         hearings.append({"date": dt, "purpose": purpose})
 
     return {
@@ -121,78 +260,130 @@ def parse_case_status_html(html: str) -> Dict[str, Any]:
     }
 
 
-def parse_cause_list_html(html: str) -> List[Dict[str, Any]]:
+class CauseListEntry(NamedTuple):
+    """One parsed cause-list row (a tuple rather than a dict per row; use _asdict() for JSON)."""
+    serial: str
+    case_text: Optional[str]
+    purpose: Optional[str]
+    court_info: Optional[str]
+    raw_cells: Tuple[str, ...]
+
+
+def parse_cause_list_html(html: str) -> List[CauseListEntry]:
     """
     Parses a cause-list result page (after you select state/district/court/date and click Civil/Criminal).
     Returns rows with serial, case_number_text, parties/counsel/purpose if visible.
     """
-    soup = BeautifulSoup(html, "lxml")
-    rows: List[Dict[str, Any]] = []
-
-    # Generic approach: find all tables; parse rows where there's a serial number.
-    tables = soup.find_all("table")
-    for table in tables:
-        for tr in table.find_all("tr"):
-            tds = [td.get_text(" ", strip=True) for td in tr.find_all(["td", "th"])]
-            if not tds or len(tds) < 2:
-                continue
-
-            # Try to detect a serial number in the first cell.
-            serial = None
-            if re.fullmatch(r"\d{1,4}", tds[0]):
-                serial = tds[0]
-            elif re.match(r"(?i)(sr\.?\s*no\.?|serial)", tds[0]):
-                # likely a header row
-                continue
-
-            if serial:
-                # Heuristic mapping:
-                case_text = None
-                court_text = None
-                purpose = None
-                # Commonly case number appears in 2nd or 3rd columns.
-                for cell in tds[1:4]:
-                    if re.search(r"\b\d{1,6}\/\d{4}\b", cell) or re.search(r"[A-Za-z]{1,10}\s*\d{1,6}\/\d{4}", cell):
-                        case_text = cell
-                        break
-                # Look for purpose/stage
-                for cell in tds:
-                    if re.search(r"(?i)(purpose|stage|for hearing|listing)", cell):
-                        purpose = cell
-                        break
-                # 'Court' sometimes shown at the top or near each block; as a fallback, scan any td
-                for cell in tds:
-                    if re.search(r"(?i)\bCourt\b", cell):
-                        court_text = cell
-                        break
-
-                rows.append({
-                    "serial": serial,
-                    "case_text": case_text,
-                    "purpose": purpose,
-                    "court_info": court_text,
-                    "raw_cells": tds
-                })
+    rows: List[CauseListEntry] = []
+    root = _html_root(html)
+    if root is None:
+        return rows
+
+    # Bind per-row callables to locals once (LOAD_FAST instead of global + attribute lookups)
+    node_text = _node_text
+    serial_fullmatch = _SERIAL_RE.fullmatch
+    case_search = _CASE_TEXT_RE.search
+    purpose_search = _PURPOSE_CELL_RE.search
+    court_search = _COURT_CELL_RE.search
+    row_labels = _row_labels if _LABEL_AUTOMATON is not None else None
+    row_text_of = _row_text
+    cell_at = _cell_at
+    add_row = rows.append
+
+    # Generic approach: walk candidate table rows; keep rows where there's a serial number.
+    for tr in _TABLE_ROW_XPATH(root):
+        tds = [node_text(td) for td in tr.iterchildren("td", "th")]
+
+        # Serial number in the first cell (header rows like 'Sr. No.' fall out here).
+        if not serial_fullmatch(tds[0]):
+            continue
+        serial = tds[0]
+
+        # Heuristic mapping:
+        case_text = None
+        court_text = None
+        purpose = None
+        # Commonly case number appears in 2nd or 3rd columns.
+        for cell in tds[1:4]:
+            if case_search(cell):
+                case_text = cell
+                break
+        # Labels are searched over the whole row; the cell is found by counting separators.
+        row_text = row_text_of(tds)
+        if row_labels is not None:
+            purpose, court_text = row_labels(tds, row_text)
+        else:
+            # Look for purpose/stage
+            m = purpose_search(row_text)
+            if m:
+                purpose = cell_at(tds, row_text, m.start())
+            # 'Court' sometimes shown at the top or near each block; as a fallback, scan any td
+            m = court_search(row_text)
+            if m:
+                court_text = cell_at(tds, row_text, m.start())
+
+        add_row(CauseListEntry(
+            serial=serial,
+            case_text=case_text,
+            purpose=purpose,
+            court_info=court_text,
+            raw_cells=tuple(tds)
+        ))
     return rows
 
 
-def find_case_in_cause_list(entries: List[Dict[str, Any]], case_key: str) -> Optional[Dict[str, Any]]:
+def find_case_in_cause_list(entries: List[CauseListEntry], case_key: str) -> Optional[CauseListEntry]:
     """
     Searches parsed cause-list entries for a case by a flexible key, e.g. "OS 123/2024".
     Returns the matched entry with serial & court.
     """
     # normalize key
-    key_norm = re.sub(r"\s+", " ", case_key).strip().lower()
+    key_norm = _WS_RE.sub(" ", case_key).strip().lower()
+    # whitespace-free form for a cheap prefilter: any row containing key_norm contains this too
+    key_compact = "".join(key_norm.split())
+    # Each whitespace-free token of the key must lie inside a single cell, so the longest
+    # one (usually "123/2024") is probed per cell before any string is built for the row.
+    # Tokens without letters need no lower() of the cell either.
+    probe = max(key_norm.split(), key=len, default="")
+    probe_caseless = probe.upper() == probe
 
     for e in entries:
-        big_text = " ".join(e.get("raw_cells") or [])
-        big_text_norm = re.sub(r"\s+", " ", big_text).strip().lower()
+        cells = e.raw_cells
+        if probe:
+            for cell in cells:
+                if probe in (cell if probe_caseless else cell.lower()):
+                    break
+            else:
+                continue
+        if key_compact not in "".join("".join(cells).split()).lower():
+            continue
+        big_text = " ".join(cells)
+        big_text_norm = _WS_RE.sub(" ", big_text).strip().lower()
         if key_norm in big_text_norm:
             return e
 
     return None
 
 
+def parse_pdf_links(html: str, base_url: str) -> List[str]:
+    """
+    Returns absolute URLs of all <a href> links containing 'pdf', in page order.
+    Relative links are resolved against <base href> (if any) or base_url, as the browser does.
+    """
+    root = _html_root(html)
+    if root is None:
+        return []
+    base = root.xpath("string(//base/@href)").strip()
+    base = urljoin(base_url, base) if base else base_url
+
+    links: List[str] = []
+    for href in root.xpath("//a/@href"):
+        url = urljoin(base, href.strip())
+        if "pdf" in url.lower():
+            links.append(url)
+    return links
+
+
 # === Scraper class ===
 
 @dataclasses.dataclass
@@ -223,6 +414,10 @@ class ECourtsScraper:
         self.driver = self._create_driver(browser=browser, headless=headless)
         self.wait = WebDriverWait(self.driver, 30)
 
+        # HTTP session for downloads, reused across flows (see _get_session)
+        self._session: Optional[requests.Session] = None
+        self._session_cookies: Dict[Tuple[str, Optional[str]], str] = {}
+
         log(f"Initialized webdriver with browser={browser}, headless={headless}", self.verbose)
 
     def _create_driver(self, browser: str, headless: bool):
@@ -256,9 +451,15 @@ class ECourtsScraper:
         self.driver.get(ECOURTS_CAUSELIST)
         self.wait.until(lambda d: d.execute_script("return document.readyState") == "complete")
 
-    def get_page_html(self) -> str:
-        # allow dynamic page to settle a bit
-        time.sleep(1.0)
+    def get_page_html(self, settle_locator: Optional[Tuple[str, str]] = None) -> str:
+        # wait until the dynamic page has rendered the expected element (returns as soon as it appears)
+        if settle_locator:
+            try:
+                WebDriverWait(self.driver, 10, poll_frequency=0.2).until(
+                    EC.presence_of_element_located(settle_locator)
+                )
+            except TimeoutException:
+                log(f"Timed out waiting for {settle_locator}; parsing the page as-is", self.verbose)
         return self.driver.page_source
 
     def ask_user_to_continue(self, message: str = "Complete the form & CAPTCHA in the opened browser, then press ENTER here to continue..."):
@@ -276,7 +477,7 @@ class ECourtsScraper:
         print("[Terminal] When the results page is visible, press ENTER here to continue.")
         self.ask_user_to_continue()
 
-        html = self.get_page_html()
+        html = self.get_page_html(CASE_STATUS_READY)
         overview = parse_case_status_html(html)
         log(f"Parsed case overview: {overview}", self.verbose)
 
@@ -291,7 +492,7 @@ class ECourtsScraper:
         self,
         section: str = "Civil",
         download_pdf: bool = False
-    ) -> Tuple[List[Dict[str, Any]], Optional[str], List[str]]:
+    ) -> Tuple[List[CauseListEntry], Optional[str], List[str]]:
         """
         Opens the cause list page, asks user to:
           - Select State/District/Court Complex/Court
@@ -309,7 +510,7 @@ class ECourtsScraper:
         print("[Terminal] When the cause list is visible, press ENTER here to continue.")
         self.ask_user_to_continue()
 
-        html = self.get_page_html()
+        html = self.get_page_html(CAUSELIST_READY)
         entries = parse_cause_list_html(html)
         log(f"Parsed {len(entries)} cause list entries", self.verbose)
 
@@ -330,43 +531,91 @@ class ECourtsScraper:
         Collect all <a> elements with 'pdf' in href from the current page and download them using 'requests'
         with the Selenium session cookies attached.
         """
-        anchors = self.driver.find_elements(By.TAG_NAME, "a")
-        hrefs = []
-        for a in anchors:
-            try:
-                href = a.get_attribute("href")
-                if href and "pdf" in href.lower():
-                    hrefs.append(href)
-            except Exception:
-                continue
+        # One page_source read instead of a WebDriver round-trip per anchor.
+        hrefs = parse_pdf_links(self.driver.page_source, self.driver.current_url)
 
-        unique_hrefs = sorted(set(hrefs))
+        unique_hrefs = list(dict.fromkeys(hrefs))  # dedupe, keeping page order
         log(f"Found {len(unique_hrefs)} pdf-like links", self.verbose)
 
         downloaded_paths: List[str] = []
         if not unique_hrefs:
             return downloaded_paths
 
-        # Build a cookie jar from Selenium
-        s = requests.Session()
-        for c in self.driver.get_cookies():
-            s.cookies.set(c["name"], c["value"], domain=c.get("domain"))
+        s = self._get_session()
 
-        for url in unique_hrefs:
-            try:
-                r = s.get(url, timeout=60)
+        # Every link gets its own target file before any worker starts writing.
+        paths = self._pdf_target_paths(unique_hrefs)
+
+        # Fetch concurrently; map() keeps results in link order.
+        workers = min(PDF_DOWNLOAD_WORKERS, len(unique_hrefs))
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            for path in ex.map(lambda job: self._fetch_one_pdf(s, *job), zip(unique_hrefs, paths)):
+                if path:
+                    downloaded_paths.append(path)
+
+        return downloaded_paths
+
+    def _pdf_target_paths(self, urls: List[str]) -> List[str]:
+        """
+        Maps each URL to a distinct file under download_dir. Links that differ only in their
+        query string (e.g. display_pdf.php?id=A / ?id=B) get a numeric suffix: name_2.ext, ...
+        """
+        fallback = f"case_{int(time.time())}.pdf"
+        taken = set()
+        paths: List[str] = []
+        for url in urls:
+            fname = sanitize_filename(os.path.basename(url.split("?")[0]) or fallback)
+            stem, ext = os.path.splitext(fname)
+            n = 1
+            # compare case-insensitively: 'A.pdf' and 'a.pdf' clash on Windows/macOS
+            while fname.lower() in taken:
+                n += 1
+                fname = f"{stem}_{n}{ext}"
+            taken.add(fname.lower())
+            paths.append(os.path.join(self.download_dir, fname))
+        return paths
+
+    def _fetch_one_pdf(self, s: requests.Session, url: str, path: str) -> Optional[str]:
+        """Downloads a single PDF link to path; returns path, or None if it was not a PDF or failed."""
+        # Stream into a temp file and move it into place only once the body is complete,
+        # so a dropped connection never leaves a truncated PDF under download_dir.
+        part_path = path + ".part"
+        try:
+            # Stream to disk in chunks rather than buffering the whole PDF in memory.
+            with s.get(url, stream=True, timeout=60) as r:
                 if r.status_code == 200 and r.headers.get("content-type", "").lower().startswith("application/pdf"):
-                    fname = sanitize_filename(os.path.basename(url.split("?")[0]) or f"case_{int(time.time())}.pdf")
-                    path = os.path.join(self.download_dir, fname)
                     ensure_dir(os.path.dirname(path))
-                    with open(path, "wb") as f:
-                        f.write(r.content)
-                    downloaded_paths.append(path)
+                    r.raw.decode_content = True  # undo any gzip/deflate transfer encoding
+                    with open(part_path, "wb") as f:
+                        shutil.copyfileobj(r.raw, f, length=1 << 20)
+                    os.replace(part_path, path)
                     log(f"Downloaded PDF: {path}", self.verbose)
-            except Exception as ex:
-                log(f"Failed to download {url}: {ex}", self.verbose)
+                    return path
+        except Exception as ex:
+            log(f"Failed to download {url}: {ex}", self.verbose)
+            try:
+                os.remove(part_path)
+            except OSError:
+                pass
+        return None
 
-        return downloaded_paths
+    def _get_session(self) -> requests.Session:
+        """
+        Returns the shared download session, creating it on first use, and syncs
+        any Selenium cookies that changed since the last call.
+        """
+        if self._session is None:
+            self._session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+            self._session.mount("https://", adapter)
+            self._session.mount("http://", adapter)
+
+        for c in self.driver.get_cookies():
+            key = (c["name"], c.get("domain"))
+            if self._session_cookies.get(key) != c["value"]:
+                self._session.cookies.set(c["name"], c["value"], domain=c.get("domain"))
+                self._session_cookies[key] = c["value"]
+        return self._session
 
     def _download_first_pdf_from_current_page(self) -> Optional[str]:
         files = self._download_pdfs_from_current_page()
@@ -375,6 +624,8 @@ class ECourtsScraper:
     # ---- Clean up ----
 
     def close(self):
+        if self._session is not None:
+            self._session.close()
         try:
             self.driver.quit()
         except Exception:
@@ -383,9 +634,9 @@ class ECourtsScraper:
 
 # === Decision helpers (listed today/tomorrow) ===
 
-def is_date_in_hearings(hearings: List[Dict[str, str]], target_ddmmyyyy: str) -> bool:
-    t = target_ddmmyyyy
-    return any(h.get("date") == t for h in hearings or [])
+def hearing_dates(hearings: List[Dict[str, str]]) -> FrozenSet[str]:
+    # dd-mm-yyyy dates of all parsed hearings, for O(1) today/tomorrow membership checks
+    return frozenset(h["date"] for h in hearings or [] if h.get("date"))
 
 
 def main(argv: Optional[List[str]] = None) -> int:
@@ -418,6 +669,10 @@ def main(argv: Optional[List[str]] = None) -> int:
     if args.case_type and (not args.case_number or not args.year):
         parser.error("--case-type requires --case-number and --year")
 
+    # Dates (IST) used for the listing checks, fixed for the whole run
+    today_str = date_str_ist(0)
+    tomorrow_str = date_str_ist(1)
+
     inputs = {
         "cnr": args.cnr,
         "case_type": args.case_type,
@@ -459,7 +714,7 @@ def main(argv: Optional[List[str]] = None) -> int:
             result.downloaded_files.extend(dl)
 
         # Step 2: Cause list flow (recommended for serial + court name)
-        entries: List[Dict[str, Any]] = []
+        entries: List[CauseListEntry] = []
         cause_pdf = None
         cl_downloads: List[str] = []
         if args.causelist or args.today or args.tomorrow:
@@ -490,10 +745,10 @@ def main(argv: Optional[List[str]] = None) -> int:
             matched = find_case_in_cause_list(entries, case_key)
             if matched:
                 listing_details = {
-                    "serial": matched.get("serial"),
-                    "court": matched.get("court_info"),
-                    "case_text": matched.get("case_text"),
-                    "purpose": matched.get("purpose")
+                    "serial": matched.serial,
+                    "court": matched.court_info,
+                    "case_text": matched.case_text,
+                    "purpose": matched.purpose
                 }
                 # If you clicked 'today' in the browser, that implies listed_today=True.
                 listed_today = True if args.today else None
@@ -506,17 +761,17 @@ def main(argv: Optional[List[str]] = None) -> int:
 
         # As a fallback, if we have hearings from the case overview, try date match.
         if result.case_overview and (args.today or args.tomorrow):
-            hearings = result.case_overview.get("hearings", [])
+            dates = hearing_dates(result.case_overview.get("hearings", []))
             if args.today and listed_today is None:
-                listed_today = is_date_in_hearings(hearings, date_str_ist(0))
+                listed_today = today_str in dates
             if args.tomorrow and listed_tomorrow is None:
-                listed_tomorrow = is_date_in_hearings(hearings, date_str_ist(1))
+                listed_tomorrow = tomorrow_str in dates
 
         # Save cause-list snapshot (parsed table)
         if entries:
             result.cause_list = {
                 "count": len(entries),
-                "entries": entries,
+                "entries": [e._asdict() for e in entries],  # JSON-ready dicts
                 "pdf_path": cause_pdf
             }
 
@@ -533,23 +788,23 @@ def main(argv: Optional[List[str]] = None) -> int:
         save_json(dataclasses.asdict(result), json_path)
 
         # Human-readable text summary
-        lines = []
-        lines.append(f"Run at (UTC): {result.task_run_at}")
-        lines.append(f"Inputs: {json.dumps(inputs)}")
+        lines: List[str] = []
+        lines.append(f"Run at (UTC): {result.task_run_at}\n")
+        lines.append(f"Inputs: {json.dumps(inputs)}\n")
         if result.case_overview:
-            lines.append(f"Case Overview: {json.dumps(result.case_overview, ensure_ascii=False)}")
+            lines.append(f"Case Overview: {json.dumps(result.case_overview, ensure_ascii=False)}\n")
         if result.is_listed_today is not None:
-            lines.append(f"Listed Today: {result.is_listed_today}")
+            lines.append(f"Listed Today: {result.is_listed_today}\n")
         if result.is_listed_tomorrow is not None:
-            lines.append(f"Listed Tomorrow: {result.is_listed_tomorrow}")
+            lines.append(f"Listed Tomorrow: {result.is_listed_tomorrow}\n")
         if result.listing_details:
-            lines.append(f"Listing Details: {json.dumps(result.listing_details, ensure_ascii=False)}")
+            lines.append(f"Listing Details: {json.dumps(result.listing_details, ensure_ascii=False)}\n")
         if result.cause_list:
-            lines.append(f"Cause List: count={result.cause_list.get('count')} pdf={result.cause_list.get('pdf_path')}")
+            lines.append(f"Cause List: count={result.cause_list.get('count')} pdf={result.cause_list.get('pdf_path')}\n")
         if result.downloaded_files:
-            lines.append(f"Downloaded Files: {result.downloaded_files}")
+            lines.append(f"Downloaded Files: {result.downloaded_files}\n")
 
-        save_text("\n".join(lines) + "\n", txt_path)
+        save_text_lines(lines, txt_path)
 
         # ---- Console output ----
         print("\n=== eCourts Scraper Result ===")